@@ -5,6 +5,20 @@ from pathlib import Path
 from typing import List
 
 
+# Locale language prefix -> Tesseract traineddata name
+_TESSERACT_LANGS = {
+    'en': 'eng', 'es': 'spa', 'fr': 'fra', 'de': 'deu', 'it': 'ita',
+    'pt': 'por', 'ru': 'rus', 'ja': 'jpn', 'ko': 'kor', 'zh': 'chi_sim',
+}
+
+
+def _locale_languages() -> List[str]:
+    """OCR languages for the user's locale, always including English."""
+    loc  = os.getenv('LC_ALL') or os.getenv('LC_MESSAGES') or os.getenv('LANG') or ''
+    lang = _TESSERACT_LANGS.get(loc[:2].lower(), 'eng')
+    return ['eng'] if lang == 'eng' else [lang, 'eng']
+
+
 @dataclass
 class Config:
     """All configuration settings for KenXSearch."""
@@ -12,8 +26,13 @@ class Config:
     wayland: bool = os.getenv('XDG_SESSION_TYPE', '').lower() == 'wayland'
     desktop: str = os.getenv('XDG_CURRENT_DESKTOP', '').lower()
     temp_dir: Path = Path("/tmp")
-    screenshot_path: Path = temp_dir / "circle_to_search_capture.png"
-    playwright_user_data_dir: Path = temp_dir / "circle_search_playwright_data"
+    screenshot_path: Path = temp_dir / "circle_to_search_capture.jpg"
+    # Browser profile lives in the user's cache, not /tmp, so cookies, login
+    # and Chromium's code/shader caches survive reboots
+    cache_dir: Path = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / ".cache") / "kenxsearch"
+    playwright_user_data_dir: Path = cache_dir / "playwright_profile"
+    # Per-user runtime dir (0700), so no other user can reach the daemon
+    lens_socket_path: Path = Path(os.getenv('XDG_RUNTIME_DIR') or cache_dir) / "kenxsearch_lens.sock"
 
     # UI
     selection_color: str = "#4285F4"
@@ -23,7 +42,13 @@ class Config:
     # OCR
     min_confidence: int = 40
     min_text_length: int = 3
-    supported_languages: List[str] = None
+    ocr_text_height: int = 40        # px — glyph height selections are rescaled to
+    ocr_max_side: int = 1600         # px — upscaling never goes past this
+    # Extra thresholded variants alongside the raw capture — off by default,
+    # plain screenshots OCR better (and faster) without them
+    ocr_preprocess: bool = os.getenv('KENXSEARCH_OCR_PREPROCESS', '') == '1'
+    supported_languages: List[str] = None  # fallback when the first pass is weak
+    ocr_languages: List[str] = None        # first pass — defaults to the locale
 
     def __post_init__(self):
         if self.supported_languages is None:
@@ -31,6 +56,8 @@ class Config:
                 'eng', 'spa', 'fra', 'deu', 'ita',
                 'por', 'rus', 'jpn', 'kor', 'chi_sim',
             ]
+        if self.ocr_languages is None:
+            self.ocr_languages = _locale_languages()
 
 
 class SearchType(Enum):
@@ -3,8 +3,13 @@ KenXSearch Google Lens Integration
 Handles all search dispatch and Google Lens browser automation.
 """
 
+import signal
+import socket
+import subprocess
 import sys
+import threading
 import webbrowser
+from shutil import which
 from urllib.parse import quote_plus
 
 from src.config import config, SearchType
@@ -25,12 +30,42 @@ def dispatch(search_type: SearchType):
     }[search_type]()
 
 
+def open_url(url: str):
+    """Hand a URL to the desktop's default browser without blocking.
+
+    xdg-open is spawned directly; webbrowser.open() first probes for every
+    known browser, which costs a noticeable pause on the search path.
+    """
+    if which("xdg-open"):
+        subprocess.Popen(
+            ["xdg-open", url],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    else:
+        webbrowser.open(url)
+
+
+def _preload_playwright():
+    try:
+        import playwright.sync_api  # noqa: F401
+    except ImportError:
+        pass
+
+
 def search_text():
     """OCR the selection and open a Google text search. Falls back to visual."""
+    # If OCR comes up empty the visual fallback needs Playwright; import it
+    # while Tesseract runs so that cost overlaps the OCR instead of following
+    # it. Launching Chromium this early would flash a window on success.
+    if not config.lens_socket_path.exists():
+        threading.Thread(target=_preload_playwright, daemon=True).start()
+
     text, conf = OCRProcessor.extract_text_multi_strategy(config.screenshot_path)
-    if text and conf > config.min_confidence and len(text) >= config.min_text_length:
+    if OCRProcessor.is_usable(text, conf):
+        open_url(f"https://www.google.com/search?q={quote_plus(text)}")
         print(f"Extracted text: {text}")
-        webbrowser.open(f"https://www.google.com/search?q={quote_plus(text)}")
     else:
         print("No text found, falling back to visual search.")
         search_visual()
@@ -59,6 +94,91 @@ def search_shopping():
 # Google Lens browser automation
 # ---------------------------------------------------------------------------
 
+LENS_URLS = {
+    "translate": "https://lens.google.com/?mode=translate",
+    "shopping":  "https://lens.google.com/?mode=visual",
+    "search":    "https://lens.google.com/",
+}
+
+
+def _launch_context(pw):
+    """Launch the persistent Chromium context used for every Lens upload."""
+    config.playwright_user_data_dir.mkdir(parents=True, exist_ok=True)
+    context = pw.chromium.launch_persistent_context(
+        user_data_dir=str(config.playwright_user_data_dir),
+        headless=False,
+        no_viewport=True,
+        args=[
+            "--start-maximized",
+            "--disable-blink-features=AutomationControlled",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ],
+        # Spoof a real Chrome UA to reduce bot-detection triggers
+        user_agent=(
+            "Mozilla/5.0 (X11; Linux x86_64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/124.0.0.0 Safari/537.36"
+        ),
+        ignore_default_args=["--enable-automation"],
+    )
+
+    # Remove the navigator.webdriver flag that Google checks for bots
+    context.add_init_script(
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    )
+    return context
+
+
+def _lens_upload(page, mode: str):
+    """Open Lens in *page* and upload the captured selection into it.
+
+    Most modes are done once the upload is in — the results render in the
+    user's browser without us waiting on them. Shopping also needs
+    _open_shopping_tab() afterwards.
+    """
+    page.goto(LENS_URLS.get(mode, LENS_URLS["search"]),
+              wait_until="domcontentloaded", timeout=20000)
+
+    # Wait for the upload link and intercept the file chooser it triggers
+    upload_link = page.get_by_text("upload a file", exact=False)
+    upload_link.wait_for(timeout=15000)
+
+    with page.expect_file_chooser(timeout=10000) as fc_info:
+        upload_link.click()
+
+    # Inject the image silently — no file picker dialog shown to user
+    fc_info.value.set_files(str(config.screenshot_path))
+    print("✅ Image uploaded to Google Lens.")
+
+
+def _open_shopping_tab(page):
+    """Click the Products/Shopping tab in Lens results, best effort."""
+    print("Waiting for results to open the Shopping tab...")
+    try:
+        page.wait_for_load_state("domcontentloaded", timeout=15000)
+    except Exception:
+        pass
+    page.wait_for_timeout(3000)
+
+    try:
+        # Google Lens labels this tab "Products" not "Shopping", so try
+        # "Products" first
+        for label in ["Products", "Shopping", "Buy"]:
+            try:
+                tab = page.get_by_role("tab", name=label)
+                if not tab.is_visible():
+                    tab = page.get_by_text(label, exact=True)
+                tab.wait_for(timeout=4000)
+                tab.click()
+                page.wait_for_timeout(2000)
+                break
+            except Exception:
+                continue
+    except Exception:
+        pass
+
+
 def upload_to_google_lens(mode: str = "search"):
     """
     Open Chromium via Playwright, navigate to Google Lens, and silently
@@ -68,89 +188,30 @@ def upload_to_google_lens(mode: str = "search"):
 
     A persistent browser context is used so cookies and Google login are
     preserved between runs — this avoids repeated CAPTCHA challenges.
+    When a Lens daemon (KenXSearch --daemon) is running, the upload is
+    handed to its already-warm browser instead.
     """
+    if _send_to_daemon(mode):
+        return
+
     try:
-        from playwright.sync_api import sync_playwright, TimeoutError as PwTimeout
+        from playwright.sync_api import sync_playwright
     except ImportError:
         print("Playwright not installed — opening Lens in default browser.", file=sys.stderr)
-        webbrowser.open("https://lens.google.com/")
+        open_url("https://lens.google.com/")
         return
 
-    URLS = {
-        "translate": "https://lens.google.com/?mode=translate",
-        "shopping":  "https://lens.google.com/?mode=visual",
-        "search":    "https://lens.google.com/",
-    }
-
     print("Opening Google Lens...")
     pw      = None
     browser = None
     try:
         pw = sync_playwright().start()
-        browser = pw.chromium.launch_persistent_context(
-            user_data_dir=str(config.playwright_user_data_dir),
-            headless=False,
-            no_viewport=True,
-            args=[
-                "--start-maximized",
-                "--disable-blink-features=AutomationControlled",
-                "--no-first-run",
-                "--no-default-browser-check",
-            ],
-            # Spoof a real Chrome UA to reduce bot-detection triggers
-            user_agent=(
-                "Mozilla/5.0 (X11; Linux x86_64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/124.0.0.0 Safari/537.36"
-            ),
-            ignore_default_args=["--enable-automation"],
-        )
+        browser = _launch_context(pw)
 
         page = browser.pages[0] if browser.pages else browser.new_page()
-
-        # Remove the navigator.webdriver flag that Google checks for bots
-        page.add_init_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
-
-        page.goto(URLS.get(mode, URLS["search"]),
-                  wait_until="domcontentloaded", timeout=20000)
-
-        # Wait for the upload link and intercept the file chooser it triggers
-        upload_link = page.get_by_text("upload a file", exact=False)
-        upload_link.wait_for(timeout=15000)
-
-        with page.expect_file_chooser(timeout=10000) as fc_info:
-            upload_link.click()
-
-        # Inject the image silently — no file picker dialog shown to user
-        fc_info.value.set_files(str(config.screenshot_path))
-        print("✅ Image uploaded, waiting for results...")
-
-        try:
-            page.wait_for_load_state("domcontentloaded", timeout=15000)
-        except Exception:
-            pass
-        page.wait_for_timeout(3000)
-
-        # Shopping: click the Products/Shopping tab in Lens results
-        # Google Lens labels this tab "Products" not "Shopping"
+        _lens_upload(page, mode)
         if mode == "shopping":
-            try:
-                # Try "Products" first (current Google Lens label)
-                for label in ["Products", "Shopping", "Buy"]:
-                    try:
-                        tab = page.get_by_role("tab", name=label)
-                        if not tab.is_visible():
-                            tab = page.get_by_text(label, exact=True)
-                        tab.wait_for(timeout=4000)
-                        tab.click()
-                        page.wait_for_timeout(2000)
-                        break
-                    except Exception:
-                        continue
-            except Exception:
-                pass
+            _open_shopping_tab(page)
 
         # Wait until the user closes the browser window — works from terminal
         # and from keybindings with no terminal attached.
@@ -173,3 +234,139 @@ def upload_to_google_lens(mode: str = "search"):
                 pw.stop()
         except Exception:
             pass
+
+
+# ---------------------------------------------------------------------------
+# Lens daemon — a warm browser shared by every invocation
+# ---------------------------------------------------------------------------
+
+def _send_to_daemon(mode: str) -> bool:
+    """Ask a running Lens daemon to do the upload. False if none answers.
+
+    Once the daemon has taken the request this returns True whatever the
+    outcome: launching a local browser would then fight the daemon's
+    Chromium for the same locked profile.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(config.lens_socket_path))
+            sock.sendall(mode.encode() + b"\n")
+        except OSError:
+            return False
+
+        # The daemon replies as soon as the image is in
+        try:
+            sock.settimeout(60)
+            reply = sock.makefile("rb").readline().strip()
+        except OSError as e:
+            reply = str(e).encode()
+
+    if reply != b"ok":
+        print(f"Lens daemon failed: {reply.decode(errors='replace') or 'no reply'}",
+              file=sys.stderr)
+    else:
+        print("✅ Sent to Google Lens.")
+    return True
+
+
+def _daemon_answers() -> bool:
+    """True if something is already accepting connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(config.lens_socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def _reply(conn, msg: bytes):
+    try:
+        conn.sendall(msg)
+    except OSError:
+        pass  # The client gave up waiting
+
+
+def serve_lens_daemon():
+    """
+    Keep Chromium running and serve Lens uploads over a UNIX socket.
+
+    Chromium start-up and profile load dominate the Visual, Translate and
+    Shopping searches. With the daemon running (e.g. started at login),
+    each search only opens a new tab in the warm browser. Requests are one
+    line holding the mode; the image is always config.screenshot_path.
+    """
+    from playwright.sync_api import sync_playwright
+
+    sock_path = config.lens_socket_path
+    if _daemon_answers():
+        print(f"Lens daemon already running on {sock_path}", file=sys.stderr)
+        return
+    # Nothing answered, so any socket file left behind is stale
+    sock_path.unlink(missing_ok=True)
+    sock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Unwind through the finally below on SIGTERM (logout, systemctl stop)
+    # so the socket file doesn't outlive the daemon
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    pw      = sync_playwright().start()
+    context = _launch_context(pw)
+    server  = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(sock_path))
+        server.listen()
+        print(f"Lens daemon listening on {sock_path}")
+
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # A client that never finishes its line must not wedge the
+                # serial accept loop for every later search
+                conn.settimeout(5)
+                try:
+                    mode = conn.makefile("rb").readline().decode(errors="replace").strip()
+                except OSError:
+                    continue
+                # Liveness probes (_daemon_answers) send nothing; anything
+                # that isn't a known mode never touches the browser
+                if mode not in LENS_URLS:
+                    continue
+
+                page = None
+                try:
+                    try:
+                        page = context.new_page()
+                    except Exception:
+                        # The user closed the browser — start a fresh one
+                        context = _launch_context(pw)
+                        page = context.pages[0] if context.pages else context.new_page()
+                    _lens_upload(page, mode)
+                except Exception as e:
+                    print(f"Error uploading to Google Lens: {e}", file=sys.stderr)
+                    _reply(conn, f"{e}\n".encode())
+                    try:
+                        if page:
+                            page.close()  # Don't leave a dead Lens tab behind
+                    except Exception:
+                        pass
+                    continue
+                # Release the client now; the Shopping tab needs no waiting on
+                _reply(conn, b"ok\n")
+            if mode == "shopping":
+                try:
+                    _open_shopping_tab(page)
+                except Exception:
+                    pass  # The user closed the tab first
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        sock_path.unlink(missing_ok=True)
+        try:
+            context.close()
+        except Exception:
+            pass
+        try:
+            pw.stop()
+        except Exception:
+            pass
\ No newline at end of file
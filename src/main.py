@@ -4,10 +4,12 @@ Dependency checking and application startup.
 """
 
 import sys
+from importlib.util import find_spec
 from shutil import which
 
 from PyQt6.QtWidgets import QApplication
 
+import src.lens as lens
 from src.config import config
 from src.overlay import EnhancedOverlay
 
@@ -39,12 +41,9 @@ class DependencyChecker:
             print(f"   Arch          : sudo pacman -S {' '.join(missing_sys)}")
             return False
 
-        missing_py = []
-        for mod, pkg in cls.PYTHON.items():
-            try:
-                __import__(mod)
-            except ImportError:
-                missing_py.append(pkg)
+        # find_spec locates a package without executing it, so the heavy
+        # imports stay deferred until a search actually needs them
+        missing_py = [pkg for mod, pkg in cls.PYTHON.items() if find_spec(mod) is None]
 
         if missing_py:
             print("\u274c Missing Python packages:", ', '.join(missing_py))
@@ -58,6 +57,10 @@ def main():
     if not DependencyChecker.check():
         sys.exit(1)
 
+    if '--daemon' in sys.argv[1:]:
+        lens.serve_lens_daemon()
+        return
+
     if config.screenshot_path.exists():
         config.screenshot_path.unlink()
 
@@ -3,90 +3,218 @@ KenXSearch OCR
 Multi-strategy text extraction using Tesseract + OpenCV preprocessing.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
-import cv2
-import pytesseract
-from PIL import Image, ImageEnhance
+import numpy as np
 
 from src.config import config
 
+# OpenMP only slows Tesseract down on images as small as a screen selection.
+# Must be set before it loads.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# LSTM engine, single uniform text block — matches the tesserocr settings
+_TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+# cv2 and the Tesseract bindings are imported where they are used:
+# this module loads with the overlay, and none of them are needed until
+# the user actually runs a text search.
+
+
+@lru_cache(maxsize=None)
+def _tesserocr():
+    """tesserocr binds libtesseract in-process — no fork and no model reload
+    per call. Returns None when it is absent and pytesseract is used instead.
+    """
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    return tesserocr
+
 
 class OCRProcessor:
     """Advanced OCR with multiple image preprocessing strategies."""
 
+    # tesserocr handles by language, reused so language data loads once
+    _apis: dict = {}
+
+    # Set once a tesserocr handle fails to initialise, so every later call
+    # goes straight to pytesseract instead of retrying and failing again
+    _tess_unusable = False
+
+    @classmethod
+    def _tess_api(cls, lang: str):
+        """The tesserocr handle for *lang*; None if it can't be used."""
+        tess = None if cls._tess_unusable else _tesserocr()
+        if tess is None:
+            return None
+
+        api = cls._apis.get(lang)
+        if api is None:
+            try:
+                api = tess.PyTessBaseAPI(
+                    lang=lang, psm=tess.PSM.SINGLE_BLOCK, oem=tess.OEM.LSTM_ONLY,
+                )
+            except RuntimeError as e:
+                # e.g. built against a different tessdata prefix than the
+                # distro's language packs, which the tesseract CLI does find
+                print(f"tesserocr unusable, falling back to pytesseract: {e}", file=sys.stderr)
+                cls._tess_unusable = True
+                return None
+            cls._apis[lang] = api
+        return api
+
+    @classmethod
+    def _ocr_words(cls, image: np.ndarray, lang: str) -> Tuple[List[str], List[int]]:
+        """Return the recognised words and their confidences for one image."""
+        words, confs = [], []
+
+        api = cls._tess_api(lang)
+        if api is not None:
+            tess = _tesserocr()
+            # Raw pixels straight in — SetImage() would round-trip a PIL
+            # image through an encoded BMP/PNG buffer first
+            h, w = image.shape[:2]
+            bpp  = 1 if image.ndim == 2 else image.shape[2]
+            api.SetImageBytes(np.ascontiguousarray(image).tobytes(), w, h, bpp, w * bpp)
+            api.Recognize()
+            it = api.GetIterator()
+            if it is not None:
+                word_level = tess.RIL.WORD
+                for r in tess.iterate_level(it, word_level):
+                    word = r.GetUTF8Text(word_level) or ''
+                    conf = int(r.Confidence(word_level))
+                    if word.strip() and conf > 0:
+                        words.append(word)
+                        confs.append(conf)
+            return words, confs
+
+        import pytesseract
+
+        data = pytesseract.image_to_data(
+            image,
+            output_type=pytesseract.Output.DICT,
+            config=_TESSERACT_CONFIG,
+            lang=lang,
+            timeout=10,
+        )
+        for word, conf in zip(data['text'], data['conf']):
+            conf = int(conf)
+            if conf > 0 and word.strip():
+                words.append(word)
+                confs.append(conf)
+        return words, confs
+
     @staticmethod
-    def preprocess_image(image_path: Path) -> List[Path]:
-        """Return a list of preprocessed image variants to try OCR on."""
-        processed = []
+    def _text_scale(gray: np.ndarray) -> float:
+        """Resize factor that brings the median glyph height to the target."""
+        import cv2
+
+        # Glyphs must come out as foreground, whichever the text polarity
+        flag = cv2.THRESH_BINARY_INV if gray.mean() > 127 else cv2.THRESH_BINARY
+        _, bw = cv2.threshold(gray, 0, 255, flag + cv2.THRESH_OTSU)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(bw, connectivity=8)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        h, w = gray.shape[:2]
+        # Ignore specks, and borders/boxes/backgrounds spanning the selection
+        glyphs = (heights > 2) & (heights <= h // 2) & (widths <= w // 2)
+        heights = heights[glyphs]
+        # Too few glyphs to say anything reliable about the text size
+        if heights.size < 4:
+            return 1.0
+
+        median = float(np.median(heights))
+        if median > 60 or median < 15:
+            return min(max(config.ocr_text_height / median, 0.25), 4.0)
+        return 1.0
+
+    @staticmethod
+    def preprocess_image(image_path: Path) -> List[np.ndarray]:
+        """Return in-memory image variants to try OCR on, raw capture first."""
+        import cv2
+
+        # Tesseract binarises a grayscale image internally anyway, so decode
+        # straight to gray: for the JPEG capture that is just the Y plane,
+        # with no colour conversion or 3-channel buffer
+        img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            return []
+
+        # Tesseract's time grows with pixel count: shrink large screen text,
+        # and enlarge tiny text, which it misreads
+        scale = OCRProcessor._text_scale(img)
+        if scale > 1.0:
+            # Never enlarge a big selection past the size cap — tiny text
+            # across a wide area would otherwise balloon the pixel count
+            scale = min(scale, max(1.0, config.ocr_max_side / max(img.shape[:2])))
+        if scale != 1.0:
+            interp = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=interp)
+
+        processed = [img]
+        if not config.ocr_preprocess:
+            return processed
+
         try:
-            img = cv2.imread(str(image_path))
-            if img is None:
-                return [image_path]
-
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-            # Strategy 1: Adaptive threshold — best for varied lighting
-            adaptive = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                cv2.THRESH_BINARY, 11, 2,
-            )
-            p1 = config.temp_dir / "ocr_adaptive.png"
-            cv2.imwrite(str(p1), adaptive)
-            processed.append(p1)
-
-            # Strategy 2: Otsu binary threshold
-            _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            p2 = config.temp_dir / "ocr_otsu.png"
-            cv2.imwrite(str(p2), otsu)
-            processed.append(p2)
-
-            # Strategy 3: Contrast-enhanced grayscale
-            enhanced = ImageEnhance.Contrast(Image.open(image_path).convert('L')).enhance(2.0)
-            p3 = config.temp_dir / "ocr_enhanced.png"
-            enhanced.save(p3)
-            processed.append(p3)
+            # Strategy 2: Otsu binary threshold — one histogram
+            # pass, and it subsumes a separate contrast-stretched variant.
+            # A dark (dark-mode) background is inverted in the same pass so
+            # Tesseract always gets dark text on light, never both polarities
+            flag = cv2.THRESH_BINARY if img.mean() > 127 else cv2.THRESH_BINARY_INV
+            _, otsu = cv2.threshold(img, 0, 255, flag + cv2.THRESH_OTSU)
+            processed.append(otsu)
 
         except Exception as e:
             print(f"Image preprocessing failed: {e}", file=sys.stderr)
-            return [image_path]
 
         return processed
 
     @staticmethod
-    def extract_text_multi_strategy(image_path: Path) -> Tuple[str, float]:
-        """Run OCR with all strategies; return (best_text, confidence)."""
-        processed = OCRProcessor.preprocess_image(image_path)
+    def is_usable(text: str, conf: float) -> bool:
+        """Whether an OCR result is good enough to run a text search with."""
+        return bool(text) and conf > config.min_confidence and len(text) >= config.min_text_length
+
+    @staticmethod
+    def _best_of(processed: List[np.ndarray], lang: str) -> Tuple[str, float]:
+        """OCR every variant with the given languages; return the best result."""
         best_text, best_conf = "", 0.0
-        lang = '+'.join(config.supported_languages)
 
-        for i, path in enumerate(processed):
+        # The raw capture goes first; a preprocessed variant only costs an
+        # OCR pass when nothing before it was usable
+        for i, img in enumerate(processed):
             try:
-                data = pytesseract.image_to_data(
-                    Image.open(path),
-                    output_type=pytesseract.Output.DICT,
-                    config='--oem 3 --psm 6',
-                    lang=lang,
-                )
-                words, confs = [], []
-                for j, word in enumerate(data['text']):
-                    if word.strip() and int(data['conf'][j]) > 0:
-                        words.append(word)
-                        confs.append(int(data['conf'][j]))
-
-                if words and confs:
-                    text = ' '.join(words)
-                    avg  = sum(confs) / len(confs)
-                    if avg > best_conf:
-                        best_text, best_conf = text, avg
-
+                words, confs = OCRProcessor._ocr_words(img, lang)
             except Exception as e:
                 print(f"OCR strategy {i + 1} failed: {e}", file=sys.stderr)
+                continue
+
+            if words and confs:
+                text = ' '.join(words)
+                avg  = sum(confs) / len(confs)
+                if avg > best_conf:
+                    best_text, best_conf = text, avg
+
+            if OCRProcessor.is_usable(best_text, best_conf):
+                break
+
+        return best_text, best_conf
+
+    @staticmethod
+    def extract_text_multi_strategy(image_path: Path) -> Tuple[str, float]:
+        """Run OCR with all strategies; return (best_text, confidence)."""
+        processed = OCRProcessor.preprocess_image(image_path)
 
-        for p in processed:
-            if p != image_path:
-                p.unlink(missing_ok=True)
+        # Each extra language is another model to load and decode with, so
+        # start with the locale's; only a weak result pays for the full set
+        best = OCRProcessor._best_of(processed, '+'.join(config.ocr_languages))
+        if not OCRProcessor.is_usable(*best) and config.ocr_languages != config.supported_languages:
+            fallback = OCRProcessor._best_of(processed, '+'.join(config.supported_languages))
+            best = max(best, fallback, key=lambda r: r[1])
 
-        return best_text, best_conf
\ No newline at end of file
+        return best
\ No newline at end of file
@@ -6,11 +6,9 @@ Full-screen drawing overlay, search panel, and animated selection ring.
 import math
 import subprocess
 import sys
-from pathlib import Path
 from shutil import which
+from typing import Optional
 
-import mss
-from PIL import Image
 from PyQt6.QtCore import (Qt, QTimer, QPropertyAnimation, QRectF, QPointF,
                            QEasingCurve, pyqtSignal, pyqtProperty)
 from PyQt6.QtGui import (QPainter, QPen, QColor, QPixmap, QImage,
@@ -42,6 +40,12 @@ class _TechButton(QPushButton):
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFlat(True)
 
+        self._font = QFont()
+        self._font.setFamilies(["JetBrains Mono", "Fira Mono", "DejaVu Sans Mono", "monospace"])
+        self._font.setPointSize(9)
+        self._font.setBold(True)
+        self._font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 1.5)
+
     def _step(self):
         target = 1.0 if self._hovered else 0.0
         self._hover += (target - self._hover) * 0.15
@@ -72,12 +76,7 @@ class _TechButton(QPushButton):
         p.drawLine(0, 0, 0, l)
         p.drawLine(r.width(), r.height(), r.width()-l, r.height())
         p.drawLine(r.width(), r.height(), r.width(), r.height()-l)
-        f = QFont()
-        f.setFamilies(["JetBrains Mono", "Fira Mono", "DejaVu Sans Mono", "monospace"])
-        f.setPointSize(9)
-        f.setBold(True)
-        f.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 1.5)
-        p.setFont(f)
+        p.setFont(self._font)
         p.setPen(QColor(0, 242, 255, int(180 + h * 75)))
         p.drawText(r, Qt.AlignmentFlag.AlignCenter, self._label.upper())
 # ---------------------------------------------------------------------------
@@ -122,16 +121,19 @@ class EnhancedOverlay(QMainWindow):
     def __init__(self):
         super().__init__()
         self.path             = QPainterPath()
+        self._last_pt         = QPointF()
         self.is_drawing       = False
         self.selection_made   = False
         self.screenshot_pixmap = None
+        self.dimmed_pixmap    = None
         self.animation_timer  = QTimer(self)
         self.pulse_value      = 0.0
         self.animated_selection_rect = QRectF()
-        self._trail: list     = []
 
         self._setup_ui()
+        self._setup_paint_cache()
         self._capture_background()
+        self._bake_background()
         self._setup_animations()
 
     # ------------------------------------------------------------------ setup
@@ -181,6 +183,16 @@ class EnhancedOverlay(QMainWindow):
         # Ensure the overlay grabs focus when launched from a keybinding
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
+    def _setup_paint_cache(self):
+        """Pens and fonts reused by every frame instead of rebuilt per paint."""
+        self._bracket_pen  = QPen(QColor(0, 242, 255, 220), 2)
+        self._readout_pen  = QPen(QColor(0, 242, 255, 180))
+        self._outline_pen  = QPen(QColor(0, 242, 255, 40), 1)
+        self._stroke_pen   = QPen(QColor(0, 242, 255, 180), 1.5)
+        self._readout_font = QFont()
+        self._readout_font.setFamilies(["JetBrains Mono", "Fira Mono", "DejaVu Sans Mono", "monospace"])
+        self._readout_font.setPointSize(8)
+
     def showEvent(self, event):
         """Force keyboard focus when the overlay appears."""
         super().showEvent(event)
@@ -208,41 +220,68 @@ class EnhancedOverlay(QMainWindow):
     def _capture_background(self):
         try:
             if config.wayland:
-                tmp = config.temp_dir / "background_capture.png"
-                if self._capture_wayland(tmp):
-                    self.screenshot_pixmap = QPixmap(str(tmp))
-                    tmp.unlink(missing_ok=True)
+                self.screenshot_pixmap = self._capture_wayland()
             else:
-                sct  = mss.mss()
-                simg = sct.grab(sct.monitors[1])
-                img  = Image.frombytes('RGB', simg.size, simg.rgb)
-                qimg = QImage(img.tobytes(), img.width, img.height,
-                              QImage.Format.Format_RGB888)
+                import mss  # X11 only — Wayland sessions never load it
+
+                with mss.mss() as sct:
+                    simg = sct.grab(sct.monitors[1])
+                w, h = simg.size
+                # Wrap mss's native BGRA buffer as-is (no .rgb swizzle pass);
+                # fromImage makes the only copy
+                qimg = QImage(simg.raw, w, h, w * 4, QImage.Format.Format_RGB32)
                 self.screenshot_pixmap = QPixmap.fromImage(qimg)
         except Exception as e:
             print(f"Error capturing background: {e}", file=sys.stderr)
 
-    def _capture_wayland(self, output_path: Path) -> bool:
+    def _capture_wayland(self) -> Optional[QPixmap]:
+        tmp = config.temp_dir / "background_capture.png"
         tools = {
-            "grim":             ["grim", str(output_path)],
-            "gnome-screenshot": ["gnome-screenshot", "-f", str(output_path)],
-            "spectacle":        ["spectacle", "-b", "-n", "-o", str(output_path)],
+            # grim streams uncompressed PPM to stdout — no PNG, no temp file
+            "grim":             ["grim", "-t", "ppm", "-"],
+            "gnome-screenshot": ["gnome-screenshot", "-f", str(tmp)],
+            "spectacle":        ["spectacle", "-b", "-n", "-o", str(tmp)],
         }
         for tool, cmd in tools.items():
             if which(tool):
                 try:
-                    subprocess.run(cmd, check=True, capture_output=True, timeout=5)
-                    return output_path.exists()
+                    # Only grim's stdout carries data; everything else is
+                    # discarded instead of piped and buffered
+                    proc = subprocess.run(
+                        cmd, check=True, timeout=5,
+                        stdout=subprocess.PIPE if tool == "grim" else subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                    pixmap = QPixmap()
+                    if tool == "grim":
+                        pixmap.loadFromData(proc.stdout, "PPM")
+                    elif tmp.exists():
+                        pixmap.load(str(tmp))
+                        tmp.unlink(missing_ok=True)
+                    return None if pixmap.isNull() else pixmap
                 except Exception as e:
                     print(f"Failed to capture with {tool}: {e}", file=sys.stderr)
-        return False
+        return None
+
+    def _bake_background(self):
+        """Pre-compose the dimmed backdrop once so each frame is one blit."""
+        if not self.screenshot_pixmap:
+            return
+        self.dimmed_pixmap = QPixmap(self.screenshot_pixmap)
+        p = QPainter(self.dimmed_pixmap)
+        p.fillRect(self.dimmed_pixmap.rect(), QColor(5, 8, 15, 200))
+        p.end()
 
     # ---------------------------------------------------------------- animation
 
     def _tick(self):
         self.pulse_value = (self.pulse_value + 2.5) % 360
-        if self.selection_made or self.is_drawing:
+        if self.is_drawing:
             self.update()
+        elif self.selection_made:
+            # Only the scan line moves once the selection settles; the rect
+            # animation itself repaints in full through _set_rect
+            self.update(self.animated_selection_rect.toAlignedRect().adjusted(-2, -2, 2, 2))
 
     # ---------------------------------------------------------------- painting
 
@@ -254,8 +293,7 @@ class EnhancedOverlay(QMainWindow):
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
         p.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
 
-        p.drawPixmap(self.rect(), self.screenshot_pixmap)
-        p.fillRect(self.rect(), QColor(5, 8, 15, 200))
+        p.drawPixmap(self.rect(), self.dimmed_pixmap)
 
         if not (self.is_drawing or self.selection_made):
             return
@@ -287,7 +325,7 @@ class EnhancedOverlay(QMainWindow):
         p.fillRect(QRectF(rect.left(), scan_y - 2, rect.width(), 2), QBrush(scan_grad))
 
         # Corner brackets \u2014 int casts required: drawLine(4 args) needs ints in PyQt6
-        p.setPen(QPen(QColor(0, 242, 255, 220), 2))
+        p.setPen(self._bracket_pen)
         l  = 20
         x1 = int(rect.left())
         y1 = int(rect.top())
@@ -303,22 +341,19 @@ class EnhancedOverlay(QMainWindow):
         p.drawLine(x2,     y2,     x2,     y2 - l)
 
         # Data readouts
-        f = QFont()
-        f.setFamilies(["JetBrains Mono", "Fira Mono", "DejaVu Sans Mono", "monospace"])
-        f.setPointSize(8)
-        p.setFont(f)
-        p.setPen(QColor(0, 242, 255, 180))
+        p.setFont(self._readout_font)
+        p.setPen(self._readout_pen)
         p.drawText(rect.bottomRight() + QPointF(8, 0),
                    f"RES: {int(rect.width())}x{int(rect.height())}")
         p.drawText(rect.topLeft() - QPointF(0, 8),
                    f"LOC: {int(rect.x())},{int(rect.y())}")
 
         # Outer glow
-        p.setPen(QPen(QColor(0, 242, 255, 40), 1))
+        p.setPen(self._outline_pen)
         p.drawRect(rect)
 
     def _draw_stroke(self, p: QPainter):
-        p.setPen(QPen(QColor(0, 242, 255, 180), 1.5))
+        p.setPen(self._stroke_pen)
         p.drawPath(self.path)
 
         # ---------------------------------------------------------------- mouse
@@ -328,14 +363,22 @@ class EnhancedOverlay(QMainWindow):
             self.is_drawing     = True
             self.selection_made = False
             self.path           = QPainterPath(event.position())
-            self._trail         = [event.position()]
+            self._last_pt       = event.position()
             self.hint_label.hide()
             self.search_panel.hide()
 
     def mouseMoveEvent(self, event):
+        # No update() here — _tick repaints at 60 fps while drawing, so
+        # high-rate pointer events don't each trigger a full-screen repaint
         if self.is_drawing:
-            self.path.lineTo(event.position())
-            self.update()
+            pos = event.position()
+            dx  = pos.x() - self._last_pt.x()
+            dy  = pos.y() - self._last_pt.y()
+            # Sub-3px moves add path elements that every drawPath and
+            # boundingRect must walk, without changing the visible shape
+            if dx * dx + dy * dy >= 9.0:
+                self.path.lineTo(pos)
+                self._last_pt = pos
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self.is_drawing:
@@ -387,8 +430,10 @@ class EnhancedOverlay(QMainWindow):
         try:
             x, y, w, h = [max(0, int(v)) for v in rect.getRect()]
             if self.screenshot_pixmap and w > 0 and h > 0:
+                # JPEG encodes several times faster than PNG and makes a
+                # smaller Lens upload; q90 keeps text edges clean for OCR
                 self.screenshot_pixmap.copy(x, y, w, h).save(
-                    str(config.screenshot_path)
+                    str(config.screenshot_path), "JPEG", 90
                 )
                 print(f"Captured area: {w}x{h} at ({x}, {y})")
         except Exception as e: